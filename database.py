@@ -10,6 +10,7 @@ data on NEOs and close approaches extracted by `extract.load_neos` and
 `extract.load_approaches`.
 
 """
+from filters import NEOAttributeFilter
 
 
 class NEODatabase:
@@ -42,17 +43,20 @@ class NEODatabase:
         self._neos = neos
         self._approaches = approaches
 
-        self._neo_by_designation = {neo.designation: neo for neo in self._neos}
-        self._neo_by_name = {neo.name: neo for neo in self._neos}
-
-        # The NEOs and their close approaches.
-        self._primary_designation_index = {neo.designation: index for index, neo in enumerate(self._neos)}
+        # Index the NEOs in a single pass; unnamed NEOs are not indexed by name.
+        self._neo_by_designation = {}
+        self._neo_by_name = {}
+        for neo in self._neos:
+            self._neo_by_designation[neo.designation] = neo
+            if neo.name:
+                self._neo_by_name[neo.name] = neo
 
+        # Link the NEOs and their close approaches.
         for approach in self._approaches:
-            _designation = approach.designation
-            if _designation in self._primary_designation_index.keys():
-                approach.neo = self._neos[self._primary_designation_index[_designation]]
-                self._neos[self._primary_designation_index[_designation]].approaches.append(approach)
+            neo = self._neo_by_designation.get(approach.designation)
+            if neo is not None:
+                approach.neo = neo
+                neo.approaches.append(approach)
 
     def get_neo_by_designation(self, designation):
         """Find and return an NEO by its primary designation.
@@ -102,7 +106,18 @@ class NEODatabase:
         if not filters:
             for approach in self._approaches:
                 yield approach
+            return
+
+        # Criteria on the NEO are checked in one pass over the (much smaller)
+        # collection of NEOs, leaving a set membership test per close approach.
+        neo_filters = [f for f in filters if isinstance(f, NEOAttributeFilter)]
+        approach_filters = [f for f in filters if not isinstance(f, NEOAttributeFilter)]
+        if neo_filters:
+            matching_neos = {neo for neo in self._neos if all(f.check_neo(neo) for f in neo_filters)}
+            for approach in self._approaches:
+                if approach.neo in matching_neos and all(map(lambda f: f(approach), approach_filters)):
+                    yield approach
         else:
             for approach in self._approaches:
-                if all(map(lambda f: f(approach), filters)):
+                if all(map(lambda f: f(approach), approach_filters)):
                     yield approach
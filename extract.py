@@ -11,9 +11,13 @@ The main module calls these functions with the arguments provided at the command
 line, and uses the resulting collections to build an `NEODatabase`.
 
 """
+import collections
+import concurrent.futures
 import csv
+import itertools
 import json
 
+from helpers import cd_to_datetime
 from models import NearEarthObject, CloseApproach
 
 
@@ -24,48 +28,214 @@ def load_neos(neo_csv_path):
     :return: A collection of `NearEarthObject`s.
     """
     with open(neo_csv_path, 'r') as input_file:
-        reader = csv.DictReader(input_file)
+        reader = csv.reader(input_file)
+        header = next(reader, None)
         neos = []
+        if header is None:
+            # An empty file holds no NEOs.
+            return neos
+        # Resolve the columns of interest once, then index each row positionally.
+        i_pdes, i_name, i_diameter, i_pha = _column_indices(header, ('pdes', 'name', 'diameter', 'pha'))
         for line in reader:
-            _name = line['name'] or None
-            _diameter = float(line['diameter']) if line['diameter'] else None
-            _pha = False if line['pha'] in ['', 'N'] else True
-
-            try:
-                # Create NearEarthObject
-                neo = NearEarthObject(
-                    designation=line['pdes'],
-                    name=_name,
-                    diameter=_diameter,
-                    hazardous=_pha
-                )
-            except Exception as exp:
-                print(exp)
-            else:
-                neos.append(neo)
+            _diameter = line[i_diameter]
+            neos.append(NearEarthObject.from_columns(
+                line[i_pdes],
+                line[i_name] or None,
+                float(_diameter) if _diameter else None,
+                line[i_pha] == 'Y'
+            ))
     return neos
 
 
-def load_approaches(cad_json_path):
+def load_approaches(cad_json_path, processes=None):
     """Read close approach data from a JSON file.
 
+    The file is streamed rather than loaded whole, so only one row of the
+    (potentially very large) `data` array is decoded at a time. Rows are parsed
+    in batches, which can be spread across a pool of worker processes.
+
     :param cad_json_path: A path to a JSON file containing data about close approaches.
+    :param processes: The number of worker processes to parse rows with, or `None` to parse in this process.
     :return: A collection of `CloseApproach`es.
     """
+    approaches = []
     with open(cad_json_path, 'r') as input_file:
-        reader = json.load(input_file)
-        reader = [dict(zip(reader['fields'], data)) for data in reader['data']]
-        approaches = []
-        for line in reader:
+        batches = _iter_row_batches(input_file)
+        if processes is None:
+            for rows, indices in batches:
+                approaches.extend(itertools.starmap(CloseApproach.from_columns, _parse_rows(rows, indices)))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+                # Keep only a few batches in flight, so the rows are still streamed.
+                futures = collections.deque()
+                for rows, indices in batches:
+                    futures.append(executor.submit(_parse_rows, rows, indices))
+                    if len(futures) > 2 * processes:
+                        approaches.extend(itertools.starmap(CloseApproach.from_columns, futures.popleft().result()))
+                for future in futures:
+                    approaches.extend(itertools.starmap(CloseApproach.from_columns, future.result()))
+    return approaches
+
+
+def _iter_row_batches(input_file, batch_size=10000):
+    """Generate `(rows, indices)` batches of raw close approach rows from a JSON file.
+
+    `indices` holds the positions of the 'des', 'cd', 'dist' and 'v_rel' fields
+    within each row. Rows read before the 'fields' header (which may follow
+    'data') are held back until it is known.
+    """
+    rows = []
+    indices = None
+    for key, value in _iter_json_members(input_file, stream_key='data'):
+        if key == 'data':
+            rows.append(value)
+        elif key == 'fields':
+            indices = _column_indices(value, ('des', 'cd', 'dist', 'v_rel'))
+        if indices is not None and len(rows) >= batch_size:
+            for start in range(0, len(rows), batch_size):
+                yield rows[start:start + batch_size], indices
+            rows = []
+    if rows:
+        if indices is None:
+            raise ValueError("The close approach data has no 'fields' header.")
+        yield rows, indices
+
+
+def _parse_rows(rows, indices):
+    """Parse raw rows of close approach data into `CloseApproach.from_columns` arguments.
+
+    When `load_approaches` is given a process pool, this runs in the workers, so
+    it only returns tuples of primitive values.
+    """
+    i_des, i_cd, i_dist, i_v_rel = indices
+    return [
+        (line[i_des], cd_to_datetime(line[i_cd]) if line[i_cd] else None, float(line[i_dist]), float(line[i_v_rel]))
+        for line in rows
+    ]
+
+
+def _column_indices(header, columns):
+    """Return the positions of `columns` within `header`, checking that all of them are present.
+
+    :param header: The column names of a data file, in order.
+    :param columns: The names of the columns that are needed.
+    :return: A tuple of the positions of `columns` in `header`.
+    """
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"The data file is missing the column(s): {', '.join(missing)}.")
+    return tuple(header.index(column) for column in columns)
+
+
+class _JSONBuffer:
+    """A sliding window over a text file, from which JSON values are decoded one at a time."""
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self, input_file, chunk_size=1 << 16):
+        """Create a new `_JSONBuffer` reading `chunk_size` characters at a time from `input_file`."""
+        self._file = input_file
+        self._chunk_size = chunk_size
+        self._text = ''
+        self._pos = 0
+        # The number of characters of the file that precede the window.
+        self._offset = 0
+
+    def _fill(self):
+        """Read another chunk into the window, and return whether anything was read.
+
+        At least as much as is left in the window is read, so that a value which
+        keeps spanning the window boundary is copied a logarithmic number of times.
+        """
+        chunk = self._file.read(max(self._chunk_size, len(self._text) - self._pos))
+        if not chunk:
+            return False
+        self._offset += self._pos
+        self._text = self._text[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def error(self, message, pos=None):
+        """Return a `ValueError` for `message` at position `pos` of the window (by default, the current one)."""
+        if pos is None:
+            pos = self._pos
+        return ValueError(f"{message}: character {self._offset + pos} of the JSON input.")
+
+    def at_end(self):
+        """Skip whitespace and return whether the input is exhausted."""
+        while True:
+            text, pos = self._text, self._pos
+            while pos < len(text) and text[pos] in ' \t\n\r':
+                pos += 1
+            self._pos = pos
+            if pos < len(text):
+                return False
+            if not self._fill():
+                return True
+
+    def peek(self):
+        """Skip whitespace and return the next significant character."""
+        if self.at_end():
+            raise self.error("Unexpected end of JSON input")
+        return self._text[self._pos]
+
+    def expect(self, char):
+        """Consume the next significant character, which must be `char`."""
+        if self.peek() != char:
+            raise self.error(f"Expecting {char!r}")
+        self._pos += 1
+
+    def value(self):
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
             try:
-                approach = CloseApproach(
-                    designation=line['des'],
-                    time=line['cd'],
-                    distance=float(line['dist']),
-                    velocity=float(line['v_rel'])
-                )
-            except Exception as exp:
-                print(exp)
+                value, end = self._decoder.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError as err:
+                # Only an error at the very end of the window (or an unclosed
+                # string) can be a value cut off by the window; anything else
+                # is malformed input.
+                truncated = err.msg.startswith('Unterminated string') or len(self._text) - err.pos <= 6
+                if not (truncated and self._fill()):
+                    raise self.error(err.msg, err.pos) from err
+                continue
+            # A number running up to the end of the window may be truncated.
+            if end < len(self._text) or not self._fill():
+                self._pos = end
+                return value
+
+
+def _iter_json_members(input_file, stream_key, chunk_size=1 << 16):
+    """Generate the `(key, value)` members of the JSON object held in `input_file`.
+
+    The array under `stream_key` is never built in memory: a `(stream_key, item)`
+    pair is generated for each of its elements instead.
+
+    :param input_file: A text file containing a single JSON object.
+    :param stream_key: The key of the (large) array to stream element by element.
+    :param chunk_size: The number of characters to read from `input_file` at a time.
+    :return: A stream of `(key, value)` pairs, in file order.
+    """
+    buffer = _JSONBuffer(input_file, chunk_size)
+    buffer.expect('{')
+    if buffer.peek() != '}':
+        while True:
+            key = buffer.value()
+            buffer.expect(':')
+            if key == stream_key and buffer.peek() == '[':
+                buffer.expect('[')
+                if buffer.peek() != ']':
+                    while True:
+                        yield key, buffer.value()
+                        if buffer.peek() != ',':
+                            break
+                        buffer.expect(',')
+                buffer.expect(']')
             else:
-                approaches.append(approach)
-    return approaches
+                yield key, buffer.value()
+            if buffer.peek() != ',':
+                break
+            buffer.expect(',')
+    buffer.expect('}')
+    if not buffer.at_end():
+        raise buffer.error("Extra data after the JSON object")
@@ -113,30 +113,66 @@ class VelocityFilter(AttributeFilter):
         return approach.velocity
 
 
-class DiameterFilter(AttributeFilter):
-    """A class which extends Attribute filter and return the Diameter of the Close approach objects."""
+class NEOAttributeFilter(AttributeFilter):
+    """A superclass for filters on attributes of a close approach's NEO.
+
+    Because the criterion only depends on the NEO, it can be evaluated once per
+    `NearEarthObject` (with `check_neo`) rather than once per close approach,
+    which `NEODatabase.query` takes advantage of.
+
+    Concrete subclasses override the `get_neo` classmethod instead of `get`.
+    """
+
+    def check_neo(self, neo):
+        """Return whether the supplied `NearEarthObject` satisfies this filter."""
+        return self.op(self.get_neo(neo), self.value)
 
     @classmethod
     def get(cls, approach):
-        """Return the diameter of the close approach object.
+        """Get the attribute of interest from the NEO of a close approach.
 
         :param approach: A `CloseApproach` on which to evaluate this filter.
+        :return: The value of an attribute of interest of the approach's NEO.
+        """
+        return cls.get_neo(approach.neo)
+
+    @classmethod
+    def get_neo(cls, neo):
+        """Get an attribute of interest from a near-Earth object.
+
+        Concrete subclasses must override this method to get an attribute of
+        interest from the supplied `NearEarthObject`.
+
+        :param neo: A `NearEarthObject` on which to evaluate this filter.
+        :return: The value of an attribute of interest, comparable to `self.value` via `self.op`.
+        """
+        raise UnsupportedCriterionError
+
+
+class DiameterFilter(NEOAttributeFilter):
+    """A class which extends NEOAttribute filter and return the Diameter of the Close approach objects."""
+
+    @classmethod
+    def get_neo(cls, neo):
+        """Return the diameter of the near-Earth object.
+
+        :param neo: A `NearEarthObject` on which to evaluate this filter.
         :return: diameter
         """
-        return approach.neo.diameter
+        return neo.diameter
 
 
-class HazardousFilter(AttributeFilter):
-    """A class which extends Attribute filter and returns how much hazardous the Close approach objects is."""
+class HazardousFilter(NEOAttributeFilter):
+    """A class which extends NEOAttribute filter and returns how much hazardous the Close approach objects is."""
 
     @classmethod
-    def get(cls, approach):
-        """Return the hazardous value of the close approach object.
+    def get_neo(cls, neo):
+        """Return the hazardous value of the near-Earth object.
 
-        :param approach: A `CloseApproach` on which to evaluate this filter.
+        :param neo: A `NearEarthObject` on which to evaluate this filter.
         :return: hazardous attribute
         """
-        return approach.neo.hazardous
+        return neo.hazardous
 
 
 def create_filters(
@@ -12,6 +12,12 @@ provide that level of resolution, so the output format also will not.
 """
 import datetime
 
+# English month abbreviations, as used by the `cd` field, mapped to month numbers.
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
 
 def cd_to_datetime(calendar_date):
     """Convert a NASA-formatted calendar date/time description into a datetime.
@@ -23,9 +29,21 @@ def cd_to_datetime(calendar_date):
 
     This will become the Python object `datetime.datetime(2020, 12, 31, 12, 0)`.
 
+    Well-formed values are fixed-width, so they are sliced apart directly rather
+    than run through `strptime`; anything else falls back to `strptime`, which
+    raises a `ValueError` on malformed input.
+
     :param calendar_date: A calendar date in YYYY-bb-DD hh:mm format.
     :return: A naive `datetime` corresponding to the given calendar date and time.
     """
+    if (len(calendar_date) == 17 and calendar_date[4] == calendar_date[8] == '-'
+            and calendar_date[11] == ' ' and calendar_date[14] == ':'):
+        year, day, hour, minute = calendar_date[0:4], calendar_date[9:11], calendar_date[12:14], calendar_date[15:17]
+        if (year + day + hour + minute).isdigit():
+            try:
+                return datetime.datetime(int(year), _MONTHS[calendar_date[5:8]], int(day), int(hour), int(minute))
+            except (KeyError, ValueError):
+                pass
     return datetime.datetime.strptime(calendar_date, "%Y-%b-%d %H:%M")
 
 
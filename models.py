@@ -16,8 +16,13 @@ data files from NASA, so these objects should be able to handle all the
 quirks of the data set, such as missing names and unknown diameters.
 
 """
+import sys
+
 from helpers import cd_to_datetime, datetime_to_str
 
+# Placeholder for unknown diameters, distances and velocities.
+_NAN = float('nan')
+
 
 class NearEarthObject:
     """A near-Earth object (NEO).
@@ -32,6 +37,8 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'hazardous', 'approaches')
+
     def __init__(self, **info):
         """Create a new `NearEarthObject`.
 
@@ -40,13 +47,35 @@ class NearEarthObject:
         self.designation = info.get('designation')
         self.name = info.get('name')
         self.diameter = info.get('diameter')
-        if not self.diameter:
-            self.diameter = float('nan')
+        if self.diameter is None:
+            self.diameter = _NAN
         self.hazardous = info.get('hazardous')
 
         # Empty initial collection of linked approaches.
         self.approaches = []
 
+    @classmethod
+    def from_columns(cls, designation, name, diameter, hazardous):
+        """Create a new `NearEarthObject` from positional column values.
+
+        This is the loaders' fast path: it skips the keyword-argument packing
+        and lookups of `__init__`, but otherwise builds the same object. The
+        designation is interned, so it is shared with the close approaches.
+
+        :param designation: The primary designation of the NEO.
+        :param name: The IAU name of the NEO, or `None`.
+        :param diameter: The diameter of the NEO in kilometers, or `None` if unknown.
+        :param hazardous: Whether the NEO is potentially hazardous.
+        :return: A new `NearEarthObject`.
+        """
+        self = object.__new__(cls)
+        self.designation = sys.intern(designation)
+        self.name = name
+        self.diameter = _NAN if diameter is None else diameter
+        self.hazardous = hazardous
+        self.approaches = []
+        return self
+
     @property
     def fullname(self):
         """Return a representation of the full name of this NEO."""
@@ -89,6 +118,8 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('_designation', 'time', 'distance', 'velocity', 'neo', '_time_str')
+
     def __init__(self, **info):
         """Create a new `CloseApproach`.
 
@@ -98,12 +129,43 @@ class CloseApproach:
         self.time = info.get('time')
         if self.time:
             self.time = cd_to_datetime(self.time)
-        self.distance = info.get('distance', float('nan'))
-        self.velocity = info.get('velocity', float('nan'))
+        self.distance = info.get('distance')
+        if self.distance is None:
+            self.distance = _NAN
+        self.velocity = info.get('velocity')
+        if self.velocity is None:
+            self.velocity = _NAN
 
         # Attribute for the referenced NEO
         self.neo = info.get('neo')
 
+        # Formatted approach time, filled in on first use by `time_str`.
+        self._time_str = None
+
+    @classmethod
+    def from_columns(cls, designation, time, distance, velocity):
+        """Create a new `CloseApproach` from positional column values.
+
+        This is the loaders' fast path: it skips the keyword-argument packing
+        and lookups of `__init__`, but otherwise builds the same object. The
+        designation is interned, so it is shared with the NEO and its other
+        close approaches.
+
+        :param designation: The primary designation of the approaching NEO.
+        :param time: The approach time, as a naive `datetime`.
+        :param distance: The nominal approach distance in astronomical units.
+        :param velocity: The relative approach velocity in kilometers per second.
+        :return: A new `CloseApproach`, not yet linked to its NEO.
+        """
+        self = object.__new__(cls)
+        self._designation = sys.intern(designation)
+        self.time = time
+        self.distance = distance
+        self.velocity = velocity
+        self.neo = None
+        self._time_str = None
+        return self
+
     @property
     def designation(self):
         """Return designation."""
@@ -122,11 +184,13 @@ class CloseApproach:
         formatted string that can be used in human-readable representations and
         in serialization to CSV and JSON files.
         """
-        # Formatted representation of the approach time.
-        if self.time:
-            return datetime_to_str(self.time)
-        else:
-            return 'The DateTime format is unknown.'
+        # Formatted representation of the approach time, computed once.
+        if self._time_str is None:
+            if self.time:
+                self._time_str = datetime_to_str(self.time)
+            else:
+                self._time_str = 'The DateTime format is unknown.'
+        return self._time_str
 
     def __str__(self):
         """Return `str(self)`."""
@@ -141,7 +205,7 @@ class CloseApproach:
     def format(self):
         """Return the formatted form of self attribute."""
         formatted_self = {
-            'datetime_utc': datetime_to_str(self.time),
+            'datetime_utc': self.time_str,
             'distance_au': self.distance,
             'velocity_km_s': self.velocity
         }
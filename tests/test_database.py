@@ -36,6 +36,10 @@ class TestDatabase(unittest.TestCase):
         for approach in self.approaches:
             self.assertIsNotNone(approach.neo)
 
+    def test_database_construction_shares_designations_between_approaches_and_neos(self):
+        for approach in self.approaches:
+            self.assertIs(approach.designation, approach.neo.designation)
+
     def test_database_construction_ensures_each_neo_has_an_approaches_attribute(self):
         for neo in self.neos:
             self.assertTrue(hasattr(neo, 'approaches'))
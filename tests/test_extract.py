@@ -12,11 +12,14 @@ These tests should pass when Task 2 is complete.
 """
 import collections.abc
 import datetime
+import io
+import json
 import pathlib
 import math
+import tempfile
 import unittest
 
-from extract import load_neos, load_approaches
+from extract import load_neos, load_approaches, _iter_json_members
 from models import NearEarthObject, CloseApproach
 
 
@@ -78,6 +81,21 @@ class TestLoadNEOs(unittest.TestCase):
         self.assertEqual(neo.hazardous, True)
 
 
+class TestLoadNEOsEdgeCases(unittest.TestCase):
+    def load_text(self, text):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / 'neos.csv'
+            path.write_text(text)
+            return load_neos(path)
+
+    def test_empty_file_has_no_neos(self):
+        self.assertEqual(self.load_text(''), [])
+
+    def test_missing_column_raises(self):
+        with self.assertRaisesRegex(ValueError, 'pha'):
+            self.load_text('pdes,name,diameter\n433,Eros,16.84\n')
+
+
 class TestLoadApproaches(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -117,6 +135,95 @@ class TestLoadApproaches(unittest.TestCase):
         self.assertIsNotNone(approach)
         self.assertIsInstance(approach.velocity, float)
 
+    def test_approaches_parsed_in_processes_match(self):
+        approaches = load_approaches(TEST_CAD_FILE, processes=2)
+        self.assertEqual(
+            [(a.designation, a.time, a.distance, a.velocity) for a in approaches],
+            [(a.designation, a.time, a.distance, a.velocity) for a in self.approaches]
+        )
+
+
+class TestLoadApproachesEdgeCases(unittest.TestCase):
+    def load_text(self, text):
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / 'cad.json'
+            path.write_text(text)
+            return load_approaches(path)
+
+    def test_missing_time_is_none(self):
+        for cd in ('null', '""'):
+            with self.subTest(cd=cd):
+                approaches = self.load_text(
+                    f'{{"fields": ["des", "cd", "dist", "v_rel"], "data": [["433", {cd}, "0.1", "5.0"]]}}'
+                )
+                self.assertEqual(len(approaches), 1)
+                self.assertIsNone(approaches[0].time)
+                self.assertEqual(approaches[0].time_str, 'The DateTime format is unknown.')
+
+
+class TestIterJSONMembers(unittest.TestCase):
+    """Check the streaming JSON reader, including values split across reads."""
+
+    def members(self, text, chunk_size):
+        return list(_iter_json_members(io.StringIO(text), stream_key='data', chunk_size=chunk_size))
+
+    def assertStreamsLikeJSON(self, text):
+        expected = json.loads(text)
+        for chunk_size in range(1, len(text) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                received = {}
+                for key, value in self.members(text, chunk_size):
+                    if key == 'data':
+                        received.setdefault(key, []).append(value)
+                    else:
+                        received[key] = value
+                self.assertEqual(received, expected)
+
+    def test_value_split_mid_number(self):
+        self.assertStreamsLikeJSON('{"data": [[12345.678, -9.25e-10, 0]], "count": 1234567}')
+
+    def test_value_split_mid_string(self):
+        self.assertStreamsLikeJSON('{"data": [["2020 AY1", "2020-Jan-01 00:54"]], "fields": ["des", "cd"]}')
+
+    def test_value_split_mid_escape(self):
+        self.assertStreamsLikeJSON('{"data": [["a\\"b", "\\u00e9\\n\\\\"]]}')
+
+    def test_literals_split(self):
+        self.assertStreamsLikeJSON('{"data": [[true, false, null]], "other": {"k": [true]}}')
+
+    def test_data_before_fields(self):
+        members = self.members('{"data": [[1], [2]], "fields": ["a"]}', chunk_size=3)
+        self.assertEqual(members, [('data', [1]), ('data', [2]), ('fields', ['a'])])
+
+    def test_data_after_fields(self):
+        members = self.members('{"fields": ["a"], "data": [[1], [2]]}', chunk_size=3)
+        self.assertEqual(members, [('fields', ['a']), ('data', [1]), ('data', [2])])
+
+    def test_empty_object(self):
+        self.assertEqual(self.members('{}', chunk_size=1), [])
+        self.assertEqual(self.members(' { } \n', chunk_size=1), [])
+
+    def test_empty_data(self):
+        self.assertEqual(self.members('{"data": []}', chunk_size=1), [])
+
+    def test_truncated_input_raises(self):
+        text = '{"fields": ["a"], "data": [["x", 1.5], [true]]}'
+        for end in range(len(text)):
+            for chunk_size in (1, 4, 64):
+                with self.subTest(end=end, chunk_size=chunk_size):
+                    with self.assertRaises(ValueError):
+                        self.members(text[:end], chunk_size)
+
+    def test_trailing_data_raises(self):
+        with self.assertRaises(ValueError):
+            self.members('{"a": 1} junk', chunk_size=4)
+        self.assertEqual(self.members('{"a": 1}\n', chunk_size=4), [('a', 1)])
+
+    def test_malformed_row_reports_file_offset(self):
+        text = '{"data": [' + '[1], ' * 1000 + '[x]]}'
+        with self.assertRaisesRegex(ValueError, f"character {text.index('x')} "):
+            self.members(text, chunk_size=16)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,35 @@
+"""Check that NASA-formatted calendar dates are converted to datetimes.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_helpers
+
+"""
+import datetime
+import unittest
+
+from helpers import cd_to_datetime
+
+
+class TestCdToDatetime(unittest.TestCase):
+    def test_well_formed_date(self):
+        self.assertEqual(cd_to_datetime('2020-Dec-31 12:00'), datetime.datetime(2020, 12, 31, 12, 0))
+
+    def test_matches_strptime_for_every_month(self):
+        for month in ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'):
+            calendar_date = f'1999-{month}-05 23:59'
+            with self.subTest(calendar_date=calendar_date):
+                self.assertEqual(cd_to_datetime(calendar_date),
+                                 datetime.datetime.strptime(calendar_date, '%Y-%b-%d %H:%M'))
+
+    def test_malformed_date_raises(self):
+        for calendar_date in ('2020xJanx01x00x54', '2020-Jan-01T00:54', '2020-Foo-01 00:54',
+                              '2020-Jan-32 00:54', 'abcd-Jan-01 00:54',
+                              '+020-Jan-01 00:54', '2020-Jan--1 00:54', ''):
+            with self.subTest(calendar_date=calendar_date):
+                with self.assertRaises(ValueError):
+                    cd_to_datetime(calendar_date)
+
+
+if __name__ == '__main__':
+    unittest.main()
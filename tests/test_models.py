@@ -0,0 +1,43 @@
+"""Check that `NearEarthObject`s and `CloseApproach`es handle missing values.
+
+To run these tests from the project root, run:
+
+    $ python3 -m unittest --verbose tests.test_models
+
+"""
+import math
+import unittest
+
+from models import NearEarthObject, CloseApproach
+
+
+class TestNearEarthObject(unittest.TestCase):
+    def test_designation_is_stored(self):
+        neo = NearEarthObject(designation='x', name=None, diameter=None, hazardous=False)
+        self.assertEqual(neo.designation, 'x')
+
+    def test_missing_diameter_is_nan(self):
+        neo = NearEarthObject(designation='2019 SC8', name=None, diameter=None, hazardous=False)
+        self.assertTrue(math.isnan(neo.diameter))
+
+    def test_zero_diameter_is_kept(self):
+        neo = NearEarthObject(designation='2019 SC8', name=None, diameter=0.0, hazardous=False)
+        self.assertEqual(neo.diameter, 0.0)
+
+        neo = NearEarthObject.from_columns('2019 SC8', None, 0.0, False)
+        self.assertEqual(neo.diameter, 0.0)
+
+
+class TestCloseApproach(unittest.TestCase):
+    def test_designation_is_stored(self):
+        approach = CloseApproach(designation='x', time='2020-Jan-01 00:54', distance=0.1, velocity=5.0)
+        self.assertEqual(approach.designation, 'x')
+
+    def test_missing_distance_and_velocity_are_nan(self):
+        approach = CloseApproach(designation='2020 AY1', time='2020-Jan-01 00:54')
+        self.assertTrue(math.isnan(approach.distance))
+        self.assertTrue(math.isnan(approach.velocity))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,14 +29,15 @@ def write_to_csv(results, filename):
         'designation', 'name', 'diameter_km', 'potentially_hazardous'
     )
     with open(filename, 'w', newline='') as output_file:
-        writer = csv.DictWriter(output_file, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for result in results:
-            content = {**result.format(), **result.neo.format()}
-            content['name'] = content['name'] if content['name'] is not None else ''
-            content['potentially_hazardous'] = True if content['potentially_hazardous'] else False
-            writer.writerow(content)
+        writer = csv.writer(output_file)
+        writer.writerow(fieldnames)
+        writer.writerows(
+            (
+                result.time_str, result.distance, result.velocity,
+                result.neo.designation, result.neo.name or '', result.neo.diameter, bool(result.neo.hazardous)
+            )
+            for result in results
+        )
 
 
 def write_to_json(results, filename):
@@ -50,24 +51,24 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
-    json_list = []
-    for result in results:
-        content = {**result.format(), **result.neo.format()}
-        content['name'] = content['name'] if content['name'] is not None else ''
-        content['potentially_hazardous'] = True if content['potentially_hazardous'] else False
-        json_list.append(
-            {
-                'datetime_utc': content['datetime_utc'],
-                'distance_au': content['distance_au'],
-                'velocity_km_s': content['velocity_km_s'],
+    # Without `indent`, the encoder runs in C; keep one record per line instead.
+    encoder = json.JSONEncoder()
+    with open(filename, 'w') as output_file:
+        # Records are written as they are produced, never collected into a list.
+        separator = '[\n'
+        for result in results:
+            neo = result.neo
+            output_file.write(separator)
+            output_file.write(encoder.encode({
+                'datetime_utc': result.time_str,
+                'distance_au': result.distance,
+                'velocity_km_s': result.velocity,
                 'neo': {
-                    'designation': content['designation'],
-                    'name': content['name'],
-                    'diameter_km': content['diameter_km'],
-                    'potentially_hazardous': content['potentially_hazardous'],
+                    'designation': neo.designation,
+                    'name': neo.name or '',
+                    'diameter_km': neo.diameter,
+                    'potentially_hazardous': bool(neo.hazardous),
                 },
-            }
-        )
-
-    with open(filename, 'w') as output_file:
-        json.dump(json_list, output_file, indent="\t")
+            }))
+            separator = ',\n'
+        output_file.write('[]\n' if separator == '[\n' else '\n]\n')